@@ -43,6 +43,9 @@ class MockWordTracker:
     def mark_word_not_understood(self, source, target):
         pass
     
+    def mark_bulk(self, used, not_understood):
+        pass
+    
     def save_tracking_data(self):
         pass
 
@@ -192,6 +192,8 @@ class WordTracker:
     def __init__(self, tracking_file_path: str):
         self.tracking_file = tracking_file_path
         self.word_stats = self.load_tracking_data()
+        # Bumped on every change to word_stats so callers can invalidate caches
+        self.version = 0
     
     def load_tracking_data(self) -> dict:
         """Load word usage statistics from JSON file."""
@@ -228,8 +230,13 @@ class WordTracker:
     
     def save_tracking_data(self):
         """Save word usage statistics to JSON file."""
-        with open(self.tracking_file, 'w', encoding='utf-8') as f:
-            json.dump(self.word_stats, f, ensure_ascii=False, indent=2)
+        # Serialize in memory and write once (json.dump issues a write per chunk);
+        # the rename keeps the old file intact if writing is interrupted
+        data = json.dumps(self.word_stats, ensure_ascii=False, indent=2)
+        temp_file = self.tracking_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(temp_file, self.tracking_file)
     
     def calculate_word_priority(self, word: str, translation: str) -> int:
         """Calculate priority score for a word (higher = more likely to be selected)."""
@@ -238,8 +245,16 @@ class WordTracker:
         if word_key not in self.word_stats:
             return 100  # New word - high priority
         
-        stats = self.word_stats[word_key]
-        
+        return self._priority_from_stats(self.word_stats[word_key], datetime.datetime.now())
+    
+    def priorities_bulk(self) -> dict:
+        """Calculate the priority of every tracked word in one pass, keyed like word_stats."""
+        now = datetime.datetime.now()
+        return {word_key: self._priority_from_stats(stats, now)
+                for word_key, stats in self.word_stats.items()}
+    
+    def _priority_from_stats(self, stats: dict, now: datetime.datetime) -> int:
+        """Apply the priority formula to one word's stats as of `now`."""
         # Ensure occurrences exists and is a list
         if 'occurrences' not in stats or not isinstance(stats['occurrences'], list):
             stats['occurrences'] = []
@@ -248,7 +263,7 @@ class WordTracker:
         if stats['occurrences']:
             try:
                 last_used_date = stats['occurrences'][-1]['date']
-                days_since_last_use = (datetime.datetime.now() - datetime.datetime.fromisoformat(last_used_date)).days
+                days_since_last_use = (now - datetime.datetime.fromisoformat(last_used_date)).days
             except (KeyError, ValueError, TypeError):
                 days_since_last_use = 999
         else:
@@ -274,11 +289,23 @@ class WordTracker:
         """Mark a word as not understood (to be repeated)."""
         self._add_occurrence(word, translation, repeat=True)
     
-    def _add_occurrence(self, word: str, translation: str, repeat: bool):
+    def mark_bulk(self, used: List[Tuple[str, str]], not_understood: List[Tuple[str, str]]):
+        """Record a whole review session at once: `used` words were fine, `not_understood` need repeating."""
+        # One timestamp for the whole session; the caller saves once afterwards
+        now = datetime.datetime.now().isoformat()
+        add = self._add_occurrence
+        for word, translation in used:
+            add(word, translation, False, now)
+        for word, translation in not_understood:
+            add(word, translation, True, now)
+    
+    def _add_occurrence(self, word: str, translation: str, repeat: bool, now: Optional[str] = None):
         """Add an occurrence record for a word."""
         word_key = f"{word}|{translation}"
-        now = datetime.datetime.now().isoformat()
+        if now is None:
+            now = datetime.datetime.now().isoformat()
         occurrence = {"date": now, "repeat": repeat}
+        self.version += 1
         
         if word_key not in self.word_stats:
             self.word_stats[word_key] = {
@@ -490,16 +517,14 @@ class VocabularyApp:
     
     def _review_only(self, selected_vocab: List[Tuple[str, str, str]]):
         """Run vocabulary review without AI-generated content."""
-        print(f"\n🎯 Selected vocabulary for this session:")
-        for i, (word, translation, _) in enumerate(selected_vocab, 1):
-            print(f"{i:2}. {word} → {translation}")
-        
-        print(f"\n📚 Vocabulary Reference:")
-        for word, translation, pronunciation in selected_vocab:
-            display = f"• {word} → {translation}"
-            if pronunciation:
-                display += f" [{pronunciation}]"
-            print(display)
+        # Build both listings up front and print them in one go
+        lines = [f"\n🎯 Selected vocabulary for this session:"]
+        lines.extend(f"{i:2}. {word} → {translation}"
+                     for i, (word, translation, _) in enumerate(selected_vocab, 1))
+        lines.append(f"\n📚 Vocabulary Reference:")
+        lines.extend(f"• {word} → {translation}" + (f" [{pronunciation}]" if pronunciation else "")
+                     for word, translation, pronunciation in selected_vocab)
+        print("\n".join(lines))
         
         input("\nPress Enter to start vocabulary review...")
         self._run_vocabulary_review(selected_vocab)
@@ -3,36 +3,217 @@ from tkinter import ttk, messagebox
 import json
 import os
 import datetime
-import vlc
-import sys
+import functools
+import collections
+import time
+import math
 import subprocess
+import shlex
+import re
 import threading
+import asyncio
+
+# Directory of this script; Git operations and the sync stamp live here
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Environment for git subprocesses: skip optional index lock refreshes and
+# fail fast instead of hanging on a credential prompt nobody can answer
+_GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "GIT_TERMINAL_PROMPT": "0"}
+
+# Popen options that start git in its own process group/session
+if os.name == 'nt':
+    _DETACHED = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _DETACHED = {"start_new_session": True}
+
+# Git output that indicates a credentials problem rather than a generic failure
+_AUTH_ERR_RE = re.compile(
+    r'authentication failed|access denied|permission denied'
+    r'|could not read (?:username|password)|repository not found'
+    r'|\b(?:401|403)\b|unauthorized'
+    r'|support for password authentication was removed',
+    re.IGNORECASE)
+
+# One VLC instance per process; creating it loads libvlc and probes plugins.
+# The vlc bindings themselves are only imported then, so sessions without
+# audio never load libvlc
+vlc = None
+_VLC_INSTANCE = None
+_VLC_INIT_LOCK = threading.Lock()
+
+# Event loop running every Git operation, shared by all reviewers in the process
+_GIT_LOOP = None
+_GIT_LOOP_LOCK = threading.Lock()
+
+
+def find_git_root(path):
+    """Return the enclosing Git work tree of path, or None if there is none"""
+    while True:
+        if os.path.exists(os.path.join(path, '.git')):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def simplify_polyline(points, epsilon=0.5):
+    """Drop points of a flat [x0, y0, x1, y1, ...] line that lie within epsilon
+    pixels of the simplified line (iterative Ramer-Douglas-Peucker)"""
+    n = len(points) // 2
+    if n < 3:
+        return points
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        x1, y1 = points[2 * first], points[2 * first + 1]
+        dx = points[2 * last] - x1
+        dy = points[2 * last + 1] - y1
+        # Compare cross products against epsilon * segment length instead of dividing per point
+        limit = epsilon * math.hypot(dx, dy)
+        max_dist, index = limit, None
+        for i in range(first + 1, last):
+            dist = abs(dy * (points[2 * i] - x1) - dx * (points[2 * i + 1] - y1))
+            if dist > max_dist:
+                max_dist, index = dist, i
+        if index is not None:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [c for i in range(n) if keep[i] for c in (points[2 * i], points[2 * i + 1])]
+
+
+def sorted_samples(values, count):
+    """Return values sorted highest first, thinned to at most count evenly spaced ranks.
+
+    Urgencies are small integers with many repeats, so equal values are counted
+    rather than sorted and the samples are read off the running totals.
+    """
+    counts = collections.Counter(values)
+    ordered = sorted(counts, reverse=True)
+    n = len(values)
+    if n <= count:
+        return [value for value in ordered for _ in range(counts[value])]
+
+    samples = []
+    ranks = (i * (n - 1) // (count - 1) for i in range(count))
+    rank = next(ranks)
+    seen = 0
+    for value in ordered:
+        seen += counts[value]
+        while rank is not None and rank < seen:
+            samples.append(value)
+            rank = next(ranks, None)
+    return samples
+
+
+def monotone_cubic(points, subdivisions=4):
+    """Interpolate a flat [x0, y0, x1, y1, ...] line, x increasing, with a monotone
+    cubic (PCHIP) through every point, returning subdivisions points per segment.
+
+    Unlike a Catmull-Rom spline it never overshoots between knots, so the step-shaped
+    urgency curves stay inside the chart however unevenly the knots are spaced.
+    """
+    n = len(points) // 2
+    if n < 3:
+        return points
+    xs = points[0::2]
+    ys = points[1::2]
+    widths = [xs[i + 1] - xs[i] for i in range(n - 1)]
+    slopes = [(ys[i + 1] - ys[i]) / widths[i] for i in range(n - 1)]
+    # Weighted harmonic mean of the neighbouring slopes, flat at local extrema
+    tangents = [slopes[0]]
+    for i in range(1, n - 1):
+        d0, d1 = slopes[i - 1], slopes[i]
+        if d0 * d1 <= 0:
+            tangents.append(0.0)
+        else:
+            h0, h1 = widths[i - 1], widths[i]
+            tangents.append(3 * (h0 + h1) / ((2 * h1 + h0) / d0 + (h1 + 2 * h0) / d1))
+    tangents.append(slopes[-1])
+
+    # Hermite basis values at each step: (t, h00, h10, h01, h11)
+    steps = []
+    for i in range(subdivisions):
+        t = i / subdivisions
+        t2, t3 = t * t, t * t * t
+        steps.append((t, 2 * t3 - 3 * t2 + 1, t3 - 2 * t2 + t, 3 * t2 - 2 * t3, t3 - t2))
+    curve = []
+    for i in range(n - 1):
+        x0, y0, y1, h = xs[i], ys[i], ys[i + 1], widths[i]
+        m0, m1 = tangents[i] * h, tangents[i + 1] * h
+        for t, h00, h10, h01, h11 in steps:
+            curve.append(x0 + t * h)
+            curve.append(h00 * y0 + h10 * m0 + h01 * y1 + h11 * m1)
+    curve.extend(points[-2:])
+    return curve
+
+
+@functools.lru_cache(maxsize=4096)
+def format_clock(seconds):
+    """Format whole seconds as MM:SS; the total length and each elapsed second repeat a lot"""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+@functools.lru_cache(maxsize=8)
+def chart_points(before, after, width, height, margin):
+    """Smoothed flat point lists for the before/after urgency lines.
+
+    Takes the sorted urgencies as tuples so redrawing unchanged data is a cache hit.
+    """
+    chart_width = width - margin
+    chart_height = height - margin
+    # Shared x positions, then flat [x0, y0, x1, y1, ...] lists for create_line
+    x_step = chart_width / (len(before) - 1)
+    xs = [margin + i * x_step for i in range(len(before))]
+    base = height - margin
+    y_scale = chart_height / 100
+    before_points = [c for x, v in zip(xs, before) for c in (x, base - v * y_scale)]
+    after_points = [c for x, v in zip(xs, after) for c in (x, base - v * y_scale)]
+    # Long vocabularies give many near-collinear points; only the bends matter,
+    # and the curve through them is computed here once instead of by Tk on every draw
+    # Returned as flat tuples: they are shared through the cache and handed to Tk as-is
+    return (tuple(monotone_cubic(simplify_polyline(before_points))),
+            tuple(monotone_cubic(simplify_polyline(after_points))))
+
 
 class VocabularyReviewer:
+    # Skip the startup pull if the repository was synced this recently (seconds)
+    PULL_INTERVAL = 300
+    # Audio progress polling interval (ms) and slider resolution (one pixel of the 500px track, in %)
+    PROGRESS_INTERVAL_MS = 250
+    PROGRESS_STEP = 0.2
+    # Audio-only playback with a generous read-ahead; nothing here needs low latency
+    VLC_OPTIONS = ('--no-video', '--file-caching=2000')
+
     def __init__(self, vocab_list, word_tracker, generated_text=None, audio_path=None, example_sentences=None):
         # Handle both 2-tuple and 3-tuple formats, using generic terms
-        self.vocab_list = []
-        for vocab_entry in vocab_list:
-            if len(vocab_entry) == 2:
-                source, target = vocab_entry
-                pronunciation = ""
-            else:
-                source, target, pronunciation = vocab_entry
-            self.vocab_list.append((source, target, pronunciation))
+        self.vocab_list = [(entry[0], entry[1], "") if len(entry) == 2 else tuple(entry)
+                           for entry in vocab_list]
+        # Session position of each word, used to list selections in a stable order,
+        # and the same words as tracking keys ("source|target") for the chart
+        self._vocab_index = {(source, target): i for i, (source, target, _) in enumerate(self.vocab_list)}
+        self._session_keys = frozenset(f"{source}|{target}" for source, target in self._vocab_index)
         
-        # Fix VLC initialization
-        try:
-            self.vlc_instance = vlc.Instance()
-            if self.vlc_instance is None:
-                raise Exception("VLC instance could not be created")
-            # Test if we can create a media player
-            test_player = self.vlc_instance.media_player_new()
-            if test_player is None:
-                raise Exception("VLC media player could not be created")
-        except Exception as e:
-            messagebox.showerror("Error", f"VLC media player is not installed or not working properly: {e}\nProgram will exit.")
-            sys.exit(1)
-            
+        # Whether the audio file exists; checked once per path, files don't appear mid-session
+        self._audio_ok_path = audio_path
+        self._audio_ok = bool(audio_path) and os.path.exists(audio_path)
+
+        # Probe VLC and prepare the player in the background so the window can
+        # paint right away; problems are reported when the user presses Play
+        self.vlc_instance = None
+        self._vlc_error = None
+        self._prepared_player = None
+        self._prepared_path = audio_path
+        self._vlc_wait_job = None
+        self._vlc_ready = threading.Event()
+        self._vlc_probe_started = False
+        if self._audio_ok:
+            self._start_vlc_probe(audio_path)
+
         self.word_tracker = word_tracker
         self.generated_text = generated_text
         self.audio_path = audio_path
@@ -41,6 +222,38 @@ class VocabularyReviewer:
         self.review_complete = False
         self.tiles = []
         self.save_allowed = False
+
+        # Views are built once and swapped in/out of content_frame
+        self.view_frames = {}
+        self._current_view = None
+        self._feedback_words = None
+        self._feedback_grid = None
+        self._compact_tiles = {}
+        self._shown_tiles = []
+        self._urgency_canvas = None
+        self._chart_state = None
+        self._chart_items = {}
+
+        # Chart priorities keyed by "source|target", valid for one word_tracker.version
+        self._priority_cache = {}
+        self._priority_cache_version = None
+
+        # Audio playback state (player is created on first play_audio)
+        self.vlc_player = None
+        self.audio_length = 1
+        self.audio_speed = .9
+        self._slider_dragging = False
+        self._last_progress = -1
+        # Latest time/length reported by VLC events, in milliseconds
+        self._vlc_time_ms = 0
+        self._vlc_length_ms = 0
+        self._progress_job = None
+        self._seek_job = None
+        self._speed_job = None
+        self._pending_seek = None
+        self._last_seek = None
+        self._audio_widgets = None
+
         self.root = tk.Tk()
         self.root.title("Vocabulary Review")
         self.root.geometry("1200x800")
@@ -61,43 +274,122 @@ class VocabularyReviewer:
 
         self.setup_audio_controls() # Call once to set up audio controls
         
+        # Git sync only makes sense when the app runs from a checkout; detect
+        # that once instead of spawning git processes that are bound to fail
+        self.git_enabled = find_git_root(SCRIPT_DIR) is not None
+        self._last_sync_path = os.path.join(SCRIPT_DIR, '.last_sync')
+        self._push_log_path = os.path.join(SCRIPT_DIR, '.last_push.log')
+        self._push_proc = None
+        self._push_pending = False
+        self._credential_helper_checked = False
+
         # Pull latest changes from Git on startup
-        print("🔄 Syncing with Git repository...")
-        self.sync_git_async("pull")
+        if self.git_enabled:
+            self._report_last_push()
+            if self._synced_recently():
+                print("ℹ️ Git repository was synced recently, skipping pull")
+            else:
+                print("🔄 Syncing with Git repository...")
+                self.sync_git_async("pull")
         
         self.setup_start_view()
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
-    def git_pull(self):
+    @classmethod
+    def _get_vlc_instance(cls):
+        """Create the shared VLC instance on first use and reuse it afterwards"""
+        global _VLC_INSTANCE, vlc
+        with _VLC_INIT_LOCK:
+            if _VLC_INSTANCE is None:
+                import vlc
+                instance = vlc.Instance(*cls.VLC_OPTIONS)
+                if instance is None:
+                    raise Exception("VLC instance could not be created")
+                _VLC_INSTANCE = instance
+            return _VLC_INSTANCE
+
+    def _start_vlc_probe(self, audio_path):
+        """Start the background VLC probe, once, preparing a player for audio_path"""
+        if not self._vlc_probe_started:
+            self._vlc_probe_started = True
+            self._prepared_path = audio_path
+            threading.Thread(target=self._probe_vlc, args=(audio_path,), daemon=True).start()
+
+    def _probe_vlc(self, audio_path):
+        """Initialize VLC off the UI thread, recording any failure"""
+        try:
+            self.vlc_instance = self._get_vlc_instance()
+            # Player creation and media parsing can stall, so do them here too
+            if audio_path:
+                self._prepared_player = self._build_player(audio_path)
+        except Exception as e:
+            self._vlc_error = str(e)
+        finally:
+            self._vlc_ready.set()
+
+    def _get_git_loop(self):
+        """Start the background event loop that runs every Git operation, once per process"""
+        global _GIT_LOOP
+        with _GIT_LOOP_LOCK:
+            if _GIT_LOOP is None:
+                _GIT_LOOP = asyncio.new_event_loop()
+                threading.Thread(target=_GIT_LOOP.run_forever, daemon=True).start()
+            return _GIT_LOOP
+
+    async def _run_git(self, command, timeout, shell=False, **kwargs):
+        """Run a git command (or a shell chain of them) on the sync loop.
+
+        Returns (returncode, stdout, stderr); raises TimeoutExpired after killing it.
+        """
+        if shell:
+            proc = await asyncio.create_subprocess_shell(command, cwd=SCRIPT_DIR, env=_GIT_ENV, **kwargs)
+        else:
+            proc = await asyncio.create_subprocess_exec(*command, cwd=SCRIPT_DIR, env=_GIT_ENV, **kwargs)
+        try:
+            out, err = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(command, timeout)
+        return proc.returncode, out, err
+
+    async def git_pull(self):
         """Pull latest changes from Git repository"""
         try:
-            # Get the directory containing the script
-            script_dir = os.path.dirname(os.path.abspath(__file__))
+            # Fetch and inspect the working tree at the same time, then fast-forward
+            (returncode, _, stderr), (_, status, _) = await asyncio.gather(
+                # Skip ref negotiation and the FETCH_HEAD write; the merge uses @{u}
+                self._run_git(['git', '-c', 'fetch.negotiationAlgorithm=skipping',
+                               '-c', 'protocol.version=2',
+                               'fetch', '-q', '--no-write-fetch-head'], 30,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE),
+                self._run_git(['git', 'status', '--porcelain', '--untracked-files=no'], 30,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL))
             
-            # Run git pull in the script directory
-            result = subprocess.run(['git', 'pull'], 
-                                  cwd=script_dir, 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=30)
+            if returncode == 0:
+                if status.strip():
+                    # Never merge over uncommitted tracking data; the next push commits it
+                    print("⚠️ Git pull skipped: the working tree has uncommitted changes")
+                    return False
+                # Only stderr is ever inspected, so don't buffer or decode stdout
+                returncode, _, stderr = await self._run_git(['git', 'merge', '--ff-only', '-q', '@{u}'], 30,
+                                                            stdout=subprocess.DEVNULL,
+                                                            stderr=subprocess.PIPE)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 print("✅ Successfully pulled latest changes from Git")
+                self._mark_synced()
                 return True
             else:
                 # Check for authentication failures
-                error_msg = result.stderr.lower()
-                if any(auth_error in error_msg for auth_error in [
-                    'authentication failed', 'access denied', 'permission denied',
-                    'could not read username', 'could not read password',
-                    'repository not found', '403', '401', 'unauthorized'
-                ]):
+                stderr = stderr.decode('utf-8', 'replace')
+                if _AUTH_ERR_RE.search(stderr):
                     print("🔐 Git authentication failed. Please check your credentials:")
                     print("   • For HTTPS: Update stored credentials in Windows Credential Manager")
                     print("   • For SSH: Ensure your SSH keys are set up correctly")
                     print("   • Consider using a Personal Access Token for GitHub")
                 else:
-                    print(f"⚠️ Git pull warning: {result.stderr}")
+                    print(f"⚠️ Git pull warning: {stderr}")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -111,86 +403,150 @@ class VocabularyReviewer:
             return False
     
     def git_commit_and_push(self, message="Update vocabulary tracking data"):
-        """Commit and push changes to Git repository"""
+        """Start committing and pushing changes to the Git repository.
+
+        Returns as soon as the process exists; the outcome is reported from the
+        sync loop, or at the next startup if the app has exited by then.
+        """
+        # Coalesce pushes: if one is still running, let it pick up the new
+        # changes with a single follow-up commit when it finishes
+        if self._push_proc is not None and self._push_proc.poll() is None:
+            self._push_pending = True
+            return
+        self._push_pending = False
         try:
-            # Get the directory containing the script
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            # Add all changes
-            add_result = subprocess.run(['git', 'add', '.'], 
-                          cwd=script_dir, 
-                          capture_output=True, 
-                          text=True, 
-                          timeout=30)
-            
-            if add_result.returncode != 0:
-                print(f"⚠️ Git add failed: {add_result.stderr}")
-                return False
-            
-            # Commit changes
-            commit_result = subprocess.run(['git', 'commit', '-m', message], 
-                                         cwd=script_dir, 
-                                         capture_output=True, 
-                                         text=True, 
-                                         timeout=30)
-            
-            if commit_result.returncode == 0:
-                # Push changes
-                push_result = subprocess.run(['git', 'push'], 
-                                           cwd=script_dir, 
-                                           capture_output=True, 
-                                           text=True, 
-                                           timeout=30)
-                
-                if push_result.returncode == 0:
-                    print("✅ Successfully committed and pushed changes to Git")
-                    return True
-                else:
-                    # Check for authentication failures in push
-                    error_msg = push_result.stderr.lower()
-                    if any(auth_error in error_msg for auth_error in [
-                        'authentication failed', 'access denied', 'permission denied',
-                        'could not read username', 'could not read password',
-                        'repository not found', '403', '401', 'unauthorized',
-                        'support for password authentication was removed'
-                    ]):
-                        print("🔐 Git push authentication failed. Common solutions:")
-                        print("   • GitHub: Use Personal Access Token instead of password")
-                        print("   • Run: git config --global credential.helper manager-core")
-                        print("   • Or switch to SSH: git remote set-url origin git@github.com:user/repo.git")
-                    else:
-                        print(f"⚠️ Git push error: {push_result.stderr}")
-                    return False
-            else:
-                # Check if there were no changes to commit
-                if "nothing to commit" in commit_result.stdout:
-                    print("ℹ️ No changes to commit")
-                    return True
-                else:
-                    print(f"⚠️ Git commit error: {commit_result.stderr}")
-                    return False
-                    
-        except subprocess.TimeoutExpired:
-            print("⚠️ Git operation timed out - check network connection and authentication")
-            return False
-        except FileNotFoundError:
+            # Add, commit and push in a single shell so we only spawn one process
+            quote = subprocess.list2cmdline if os.name == 'nt' else shlex.join
+            command = ' && '.join(quote(args) for args in (
+                ['git', 'add', '-A'],
+                # The auto-commits need no hooks or signing
+                ['git', 'commit', '-q', '--no-verify', '--no-gpg-sign', '-m', message],
+                ['git', 'push', '-q', '--no-verify'],
+            ))
+            # Detached from the app's console/session, so closing the window
+            # (or Ctrl+C in the terminal) doesn't interrupt a push in flight.
+            # Output goes to a log file rather than a pipe, as the app may be
+            # gone before it is written
+            with open(self._push_log_path, 'wb') as log:
+                proc = subprocess.Popen(command, shell=True, cwd=SCRIPT_DIR, env=_GIT_ENV,
+                                        stdin=subprocess.DEVNULL, stdout=log,
+                                        stderr=subprocess.STDOUT, **_DETACHED)
+        except OSError as e:
+            print(f"⚠️ Git operation error: {e}")
+            return
+        self._push_proc = proc
+        asyncio.run_coroutine_threadsafe(self._finish_push(proc), self._get_git_loop())
+
+    async def _finish_push(self, proc, timeout=60):
+        """Wait on the sync loop for a push started by git_commit_and_push and report it"""
+        deadline = time.monotonic() + timeout
+        while proc.poll() is None:
+            if time.monotonic() > deadline:
+                proc.kill()
+                self._take_push_log()
+                print("⚠️ Git operation timed out - check network connection and authentication")
+                return
+            await asyncio.sleep(0.2)
+        self._report_push(proc.returncode, self._take_push_log() or "")
+        if self._push_pending:
+            self.sync_git_async("push")
+
+    def _take_push_log(self):
+        """Read and remove the push log; None if there is none"""
+        try:
+            with open(self._push_log_path, 'rb') as f:
+                output = f.read().decode('utf-8', 'replace')
+            os.remove(self._push_log_path)
+        except OSError:
+            return None
+        return output
+
+    def _report_last_push(self):
+        """Report a push that was still running when the previous session exited"""
+        output = self._take_push_log()
+        # The chain runs quietly, so an empty log means it went through
+        if output and output.strip():
+            print("ℹ️ Result of the last Git push:")
+            self._report_push(None, output)
+
+    def _report_push(self, returncode, output):
+        """Print the outcome of a push chain; returncode is None when only its log is known"""
+        if returncode == 0:
+            print("✅ Successfully committed and pushed changes to Git")
+            self._mark_synced()
+            return True
+
+        # The shell reports a missing git executable through its exit code
+        if returncode in (127, 9009):
             print("⚠️ Git not found. Make sure Git is installed and in PATH")
             return False
-        except Exception as e:
-            print(f"⚠️ Git operation error: {e}")
+
+        # Check if there were no changes to commit
+        if "nothing to commit" in output:
+            print("ℹ️ No changes to commit")
+            return True
+
+        # Check for authentication failures in push
+        if _AUTH_ERR_RE.search(output):
+            print("🔐 Git push authentication failed. Common solutions:")
+            print("   • GitHub: Use Personal Access Token instead of password")
+            print("   • Run: git config --global credential.helper manager-core")
+            print("   • Or switch to SSH: git remote set-url origin git@github.com:user/repo.git")
+        else:
+            print(f"⚠️ Git sync error: {output}")
+        return False
+
+    async def _ensure_credential_helper(self):
+        """Configure a credential helper for this repository if git has none"""
+        if self._credential_helper_checked:
+            return
+        self._credential_helper_checked = True
+        try:
+            _, configured, _ = await self._run_git(['git', 'config', '--get', 'credential.helper'], 10,
+                                                   stdout=subprocess.PIPE,
+                                                   stderr=subprocess.DEVNULL)
+            if configured.strip():
+                return
+            # Keep credentials around so later pulls/pushes skip the auth round-trip
+            helper = 'manager-core' if os.name == 'nt' else 'cache --timeout=3600'
+            await self._run_git(['git', 'config', '--local', 'credential.helper', helper], 10,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"⚠️ Could not configure Git credential helper: {e}")
+
+    def _synced_recently(self):
+        """Whether the last successful pull/push happened within PULL_INTERVAL"""
+        try:
+            return time.time() - os.path.getmtime(self._last_sync_path) < self.PULL_INTERVAL
+        except OSError:
             return False
-    
+
+    def _mark_synced(self):
+        """Record a successful sync by touching the .last_sync stamp file"""
+        try:
+            with open(self._last_sync_path, 'a'):
+                pass
+            os.utime(self._last_sync_path, None)
+        except OSError:
+            pass
+
     def sync_git_async(self, operation="pull"):
-        """Run Git operations in a separate thread to avoid blocking UI"""
-        def run_git():
-            if operation == "pull":
-                self.git_pull()
-            elif operation == "push":
-                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.git_commit_and_push(f"Update vocabulary tracking - {timestamp}")
-        
-        thread = threading.Thread(target=run_git, daemon=True)
-        thread.start()
+        """Run a Git operation in the background to avoid blocking UI"""
+        if not self.git_enabled:
+            return
+        if operation == "push":
+            # Spawned right away so it runs even if the app exits next; only
+            # waiting for the result is left to the sync loop
+            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.git_commit_and_push(f"Update vocabulary tracking - {timestamp}")
+        else:
+            asyncio.run_coroutine_threadsafe(self._git_sync(operation), self._get_git_loop())
+
+    async def _git_sync(self, operation):
+        await self._ensure_credential_helper()
+        if operation == "pull":
+            await self.git_pull()
         
     def setup_modern_styles(self):
         """Configure modern styling for the application"""
@@ -275,13 +631,23 @@ class VocabularyReviewer:
                        relief='flat',
                        borderwidth=0)
 
+    def _show(self, name):
+        """Swap the visible view without rebuilding it"""
+        if self._current_view == name:
+            return
+        if self._current_view in self.view_frames:
+            self.view_frames[self._current_view].pack_forget()
+        self.view_frames[name].pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+        self._current_view = name
+
     def setup_start_view(self):
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-            
+        if 'start' in self.view_frames:
+            self._show('start')
+            return
+
         # Main container with padding
         main_frame = ttk.Frame(self.content_frame, style='Card.TFrame', padding="40")
-        main_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+        self.view_frames['start'] = main_frame
         
         # Header row: Title (left), Action button (right)
         header_frame = ttk.Frame(main_frame, style='Card.TFrame')
@@ -323,101 +689,219 @@ class VocabularyReviewer:
         # Action button
         btn = ttk.Button(main_frame, text="Review Vocabulary", command=self.setup_tile_view, style='Accent.TButton')
         btn.pack(side=tk.BOTTOM, pady=20)
+
+        self._show('start')
         
+    def _build_player(self, path):
+        """Create a VLC player for path with position events attached"""
+        player = self.vlc_instance.media_player_new()
+        if player is None:
+            raise Exception("VLC media player could not be created")
+        player.set_media(self.vlc_instance.media_new(path))
+
+        # Let VLC push position updates instead of querying it every tick
+        events = player.event_manager()
+        events.event_attach(vlc.EventType.MediaPlayerTimeChanged, self._on_vlc_time_changed)
+        events.event_attach(vlc.EventType.MediaPlayerLengthChanged, self._on_vlc_length_changed)
+        return player
+
+    def _create_player(self):
+        """Take the VLC player for audio_path; returns False if VLC can't provide one"""
+        if not self._vlc_ready.is_set():
+            messagebox.showwarning("Audio", "VLC is still starting up, please try again in a moment.")
+            return False
+        if self.vlc_instance is None:
+            messagebox.showerror("Error", f"VLC media player is not installed or not working properly: {self._vlc_error}")
+            return False
+
+        # Normally the probe thread has prepared it already
+        player, self._prepared_player = self._prepared_player, None
+        if player is None:
+            try:
+                player = self._build_player(self.audio_path)
+            except Exception as e:
+                messagebox.showerror("Error", str(e))
+                return False
+
+        self.vlc_player = player
+        return True
+
+    def _wait_for_vlc(self):
+        # Polled from the Tk loop; the probe thread itself never touches widgets
+        self._vlc_wait_job = None
+        if self._vlc_ready.is_set():
+            self._apply_audio_source(self.audio_path)
+        else:
+            self._vlc_wait_job = self.root.after(100, self._wait_for_vlc)
+
     def play_audio(self):
-        if hasattr(self, 'vlc_player'):
-            self.vlc_player.play()
-            self.vlc_player.set_rate(self.audio_speed)
-            self.update_audio_progress()
+        if self.vlc_player is None and not self._create_player():
+            return
+        self.vlc_player.play()
+        self.vlc_player.set_rate(self.audio_speed)
+        self._start_progress_updates()
 
     def pause_audio(self):
-        if hasattr(self, 'vlc_player'):
+        if self.vlc_player is not None:
+            # pause() toggles, so this may resume playback as well
+            pausing = self.vlc_player.get_state() == vlc.State.Playing
             self.vlc_player.pause()
+            if pausing:
+                self._stop_progress_updates()
+            else:
+                self._start_progress_updates()
 
     def stop_audio(self):
-        if hasattr(self, 'vlc_player'):
+        if self.vlc_player is not None:
             self.vlc_player.stop()
+            self._stop_progress_updates()
             self.audio_progress.set(0)
+            self._last_progress = 0
 
     def change_speed(self, delta):
         self.audio_speed = max(0.5, min(2.0, self.audio_speed + delta))
-        if hasattr(self, 'vlc_player'):
+        self.play_btn.config(text=f"▶ Play ({int(self.audio_speed*100)}%)")
+        # Rapid clicks only update the label; VLC gets the final rate 120ms later
+        if self._speed_job is not None:
+            self.root.after_cancel(self._speed_job)
+        self._speed_job = self.root.after(120, self._apply_speed)
+
+    def _apply_speed(self):
+        self._speed_job = None
+        if self.vlc_player is not None:
             self.vlc_player.set_rate(self.audio_speed)
-        if hasattr(self, 'play_btn'):
-            self.play_btn.config(text=f"▶ Play ({int(self.audio_speed*100)}%)")
+
+    def _on_slider_press(self, event):
+        self._slider_dragging = True
+        self._last_seek = None
+
+    def _on_slider_drag(self, event):
+        # Widget bindings run before the Scale's own, so read the value under the pointer
+        self.slider_seek_update(self.audio_progress_bar.get(event.x, event.y))
 
     def slider_seek_update(self, value):
-        # Called while dragging the slider, just set dragging flag
+        # Called for every pixel of drag: remember the target and seek at most every 60ms
         self._slider_dragging = True
+        self._pending_seek = float(value)
+        if self._seek_job is None:
+            self._seek_job = self.root.after(60, self._flush_seek)
+
+    def _flush_seek(self):
+        self._seek_job = None
+        if self.vlc_player is not None and self._pending_seek is not None:
+            # VLC seeks by fraction directly, no need to know the length
+            rel = min(max(self._pending_seek / 100.0, 0.0), 1.0)
+            # Each seek makes VLC re-demux, so skip one that wouldn't move anything
+            if rel != self._last_seek:
+                try:
+                    self.vlc_player.set_position(rel)
+                    self._last_seek = rel
+                except Exception:
+                    pass
+        self._pending_seek = None
 
     def slider_seek_commit(self, event=None):
-        # Called when user releases the slider, perform seek
-        if hasattr(self, 'vlc_player') and self.audio_length > 0:
-            try:
-                rel = self.audio_progress.get() / 100.0
-                rel = min(max(rel, 0), 1)
-                new_pos = rel * self.audio_length
-                self.vlc_player.set_time(int(new_pos * 1000))
-            except Exception:
-                pass
+        # Called when user releases the slider; quick successive releases only
+        # seek once, 50ms after the last one
+        if self._seek_job is not None:
+            self.root.after_cancel(self._seek_job)
+        self._pending_seek = self.audio_progress.get()
+        self._seek_job = self.root.after(50, self._commit_seek)
+
+    def _commit_seek(self):
+        self._flush_seek()
         self._slider_dragging = False
 
+    def _on_vlc_time_changed(self, event):
+        # Runs on a libvlc thread: only record the value, Tk is updated by the poll
+        self._vlc_time_ms = event.u.new_time
+
+    def _on_vlc_length_changed(self, event):
+        self._vlc_length_ms = event.u.new_length
+
+    def _start_progress_updates(self):
+        # VLC changes state asynchronously, so give it one tick to settle
+        if self._progress_job is None:
+            self._progress_job = self.root.after(self.PROGRESS_INTERVAL_MS, self.update_audio_progress)
+
+    def _stop_progress_updates(self):
+        if self._progress_job is not None:
+            self.root.after_cancel(self._progress_job)
+            self._progress_job = None
+
     def update_audio_progress(self):
-        if hasattr(self, 'vlc_player') and self.vlc_player.is_playing() and not self._slider_dragging:
-            try:
-                length = self.vlc_player.get_length() / 1000.0
-                if length > 0:
-                    self.audio_length = length
-                pos = self.vlc_player.get_time() / 1000.0
-                progress = min(100, (pos / self.audio_length) * 100)
-                self.audio_progress.set(progress)
-                
-                # Update time display
-                if hasattr(self, 'time_label'):
-                    current_time = self.format_time(pos)
-                    total_time = self.format_time(self.audio_length)
-            except:
-                pass
-        self.root.after(200, self.update_audio_progress)
+        self._progress_job = None
+        if self.vlc_player is None:
+            return
+        state = self.vlc_player.get_state()
+        if state == vlc.State.Ended:
+            self._on_track_end()
+            return
+        if state in (vlc.State.Paused, vlc.State.Stopped, vlc.State.Error):
+            # Nothing is advancing; play_audio restarts the updates
+            return
+        self._progress_job = self.root.after(self.PROGRESS_INTERVAL_MS, self.update_audio_progress)
+        if self._slider_dragging or state != vlc.State.Playing:
+            return
+
+        if self._vlc_length_ms > 0:
+            self.audio_length = self._vlc_length_ms / 1000.0
+        pos = self._vlc_time_ms / 1000.0
+
+        step = self.PROGRESS_STEP
+        progress = round(min(100, (pos / self.audio_length) * 100) / step) * step
+        # Only touch the Scale when it would move by at least a pixel
+        if progress != self._last_progress:
+            self.audio_progress.set(progress)
+            self._last_progress = progress
+
+    def _on_track_end(self):
+        # An ended VLC player must be stopped before play() works again
+        self.stop_audio()
+        self._vlc_time_ms = 0
 
     def format_time(self, seconds):
         """Format seconds into MM:SS format"""
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
-        return f"{minutes:02d}:{seconds:02d}"
+        return format_clock(int(seconds))
 
     def jump_audio(self, seconds):
-        if hasattr(self, 'vlc_player') and self.audio_length > 0:
+        # The length comes from VLC's LengthChanged event; until then a jump can't be sized
+        length_ms = self._vlc_length_ms
+        if self.vlc_player is not None and length_ms > 0:
             try:
-                cur_pos = self.vlc_player.get_time() / 1000.0
-                new_pos = min(max(cur_pos + seconds, 0), self.audio_length)
-                self.vlc_player.set_time(int(new_pos * 1000))
-                self.audio_progress.set((new_pos / self.audio_length) * 100)
+                rel = self.vlc_player.get_position() + seconds * 1000 / length_ms
+                rel = min(max(rel, 0.0), 1.0)
+                self.vlc_player.set_position(rel)
+                self.audio_progress.set(rel * 100)
+                self._last_progress = -1
             except Exception:
                 pass
 
     def seek_audio(self, event=None):
-        if hasattr(self, 'vlc_player') and self.audio_length > 0:
+        if self.vlc_player is not None:
             try:
                 # Get the click or drag position
                 widget = event.widget if event else self.audio_progress_bar
                 x = event.x if event else 0
                 width = widget.winfo_width()
                 rel = x / width if width > 0 else self.audio_progress.get() / 100.0
-                rel = min(max(rel, 0), 1)
-                new_pos = rel * self.audio_length
+                rel = min(max(rel, 0.0), 1.0)
                 self.audio_progress.set(rel * 100)
-                self.vlc_player.set_time(int(new_pos * 1000))
+                self._last_progress = -1
+                self.vlc_player.set_position(rel)
             except Exception as e:
                 pass
 
     def setup_tile_view(self):
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-            
+        # The vocabulary doesn't change during a session, so the tiles (and
+        # their selection state) are built once and reused
+        if 'tiles' in self.view_frames:
+            self._show('tiles')
+            return
+
         # Main container
         main_frame = ttk.Frame(self.content_frame, style='Card.TFrame', padding="40")
-        main_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+        self.view_frames['tiles'] = main_frame
         
         # Title section
         title = ttk.Label(main_frame, text="Select words you want to review again", style='Heading.TLabel')
@@ -426,9 +910,10 @@ class VocabularyReviewer:
         subtitle = ttk.Label(main_frame, text="Click on vocabulary items that need more practice", style='Subheading.TLabel')
         subtitle.pack(pady=(0, 30))
         
-        # Tiles grid (4 columns x 5 rows, max 20 items, no scrolling)
+        # Tiles grid (4 columns x 5 rows, max 20 items, no scrolling).
+        # It is packed only once all tiles are in place, so the geometry
+        # manager lays it out in one go
         grid_frame = ttk.Frame(main_frame)
-        grid_frame.pack(expand=True)
         
         self.tiles = []
         cols = 4
@@ -441,20 +926,27 @@ class VocabularyReviewer:
                 tile_text = f"{source} [{pronunciation}] → {target}"
             else:
                 tile_text = f"{source} → {target}"
-            tile = ttk.Button(grid_frame, text=tile_text, width=30, style='Tile.TButton')
+            tile = ttk.Button(grid_frame, text=tile_text, width=30, style='Tile.TButton',
+                              command=functools.partial(self._on_tile_click, i))
             row = i // cols
             col = i % cols
             tile.grid(row=row, column=col, padx=15, pady=10, sticky="ew")
-            tile.config(command=lambda t=tile, w=(source, target): self.toggle_tile(t, w))
             self.tiles.append((tile, (source, target)))
         
         for col in range(cols):
             grid_frame.columnconfigure(col, weight=1)
+        grid_frame.pack(expand=True)
         
         # Action button
         btn = ttk.Button(main_frame, text="Continue", command=self.check_feedback, style='Accent.TButton')
         btn.pack(pady=20)
 
+        self._show('tiles')
+
+    def _on_tile_click(self, index):
+        tile, word = self.tiles[index]
+        self.toggle_tile(tile, word)
+
     def toggle_tile(self, tile, word):
         if word in self.difficult_words:
             self.difficult_words.remove(word)
@@ -478,15 +970,48 @@ class VocabularyReviewer:
             }
 
         self.save_allowed = True
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-    
+
         # Set root background to white
         self.root.configure(bg='white')
+
+        # Only refresh the summary when the selection changed since last time
+        selection = frozenset(self.difficult_words)
+        if selection == self._feedback_words:
+            self._show('feedback')
+            return
+        self._feedback_words = selection
+        if 'feedback' not in self.view_frames:
+            self.setup_feedback_view()
+
+        # Re-lay out the tile grid; tiles are created once per word and recycled,
+        # and the rest of the view (and the chart canvas) is kept
+        grid_frame = self._feedback_grid
+        # Only the tiles of deselected words leave the grid; the rest are just moved
+        for word in self._shown_tiles:
+            if word not in selection:
+                self._compact_tiles[word].grid_remove()
         
+        # Show tiles in 2-column grid
+        unknown = len(self._vocab_index)
+        tile_list = sorted(selection, key=lambda w: (self._vocab_index.get(w, unknown), w))
+        for idx, word in enumerate(tile_list):
+            row = idx // 2
+            col = idx % 2
+            tile = self._compact_tiles.get(word)
+            if tile is None:
+                tile = self._compact_tiles[word] = self.create_compact_tile(grid_frame, *word)
+            tile.grid(row=row, column=col, padx=3, pady=3, sticky="ew")
+        self._shown_tiles = tile_list
+        
+        self.create_urgency_chart(self._feedback_chart_section, width=300, height=200, minimal=True)
+
+        self._show('feedback')
+
+    def setup_feedback_view(self):
+        """Build the static parts of the review summary view"""
         # Main container - use tk.Frame for explicit white background
         main_frame = tk.Frame(self.content_frame, bg='white')
-        main_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+        self.view_frames['feedback'] = main_frame
         
         # Header row: Title (left), Action buttons (right)
         header_frame = tk.Frame(main_frame, bg='white')
@@ -519,23 +1044,13 @@ class VocabularyReviewer:
                               font=('Segoe UI', 14), bg='white', fg='#6c757d')
         tiles_label.pack(anchor='w', pady=(0, 10))
         
-        # Grid container for tiles (fixed width)
+        # Grid container for tiles (fixed width), filled by check_feedback
         grid_frame = tk.Frame(tiles_section, bg='white', width=400)
-        grid_frame.pack(fill=tk.Y)
         grid_frame.pack_propagate(False)  # Maintain fixed width
-        
-        # Create tiles in 2-column grid
-        if self.difficult_words:
-            tile_list = list(self.difficult_words)
-            for idx, (source, target) in enumerate(tile_list):
-                row = idx // 2
-                col = idx % 2
-                tile = self.create_compact_tile(grid_frame, source, target)
-                tile.grid(row=row, column=col, padx=3, pady=3, sticky="ew")
-            
-            # Configure grid weights
-            grid_frame.columnconfigure(0, weight=1)
-            grid_frame.columnconfigure(1, weight=1)
+        grid_frame.columnconfigure(0, weight=1)
+        grid_frame.columnconfigure(1, weight=1)
+        grid_frame.pack(fill=tk.Y)
+        self._feedback_grid = grid_frame
         
         # Right section: Larger chart 
         chart_section = tk.Frame(content_frame, bg='white')
@@ -544,8 +1059,7 @@ class VocabularyReviewer:
         # Add some vertical space to align under buttons
         spacer = tk.Label(chart_section, text="", bg='white')
         spacer.pack(pady=(60, 0))
-        
-        self.create_urgency_chart(chart_section, width=300, height=200, minimal=True)
+        self._feedback_chart_section = chart_section
 
     def create_compact_tile(self, parent, source, target):
         """Create a compact tile widget with thin border"""
@@ -555,7 +1069,7 @@ class VocabularyReviewer:
         inner_frame = tk.Frame(tile_frame, bg='white')
         inner_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
         
-        # Word row
+        # Word row; Labels size themselves to the text, so long phrases are never clipped
         word_frame = tk.Frame(inner_frame, bg='white')
         word_frame.pack(fill=tk.X, pady=(0, 3))
         
@@ -567,9 +1081,8 @@ class VocabularyReviewer:
                 fg='#e74c3c', bg='white').pack(side=tk.LEFT)
         
         # Example sentence
-        key = (source, target)
-        if hasattr(self, 'example_sentences') and key in self.example_sentences:
-            sentence = self.example_sentences[key]
+        sentence = self.example_sentences.get((source, target))
+        if sentence is not None:
             sentence_frame = tk.Frame(inner_frame, bg='white')
             sentence_frame.pack(fill=tk.X)
             
@@ -612,83 +1125,129 @@ class VocabularyReviewer:
 
     def create_urgency_chart(self, parent_frame, width=350, height=120, minimal=False):
         import tkinter as tk
-        chart_canvas = tk.Canvas(parent_frame, width=width, height=height, bg='white', highlightthickness=1, highlightbackground='#dee2e6')
-        chart_canvas.pack()
-        # Create set of session words (vocab_list) for quick lookup
-        session_words = set((source, target) for source, target, _ in self.vocab_list)
-        
-        # Collect before/after data for all words
-        word_data = []
+        difficult_words = self.difficult_words
+        version = getattr(self.word_tracker, 'version', 0)
+
+        # Reuse the canvas from the previous refresh when it is still in place,
+        # and leave it alone entirely if nothing the chart depends on changed
+        chart_state = (frozenset(difficult_words), version, width, height)
+        chart_canvas = self._urgency_canvas
+        if chart_canvas is not None and chart_canvas.winfo_exists() and chart_canvas.master is parent_frame:
+            if chart_state == self._chart_state:
+                return
+            chart_canvas.configure(width=width, height=height)
+        else:
+            chart_canvas = tk.Canvas(parent_frame, width=width, height=height, bg='white', highlightthickness=1, highlightbackground='#dee2e6',
+                                     takefocus=0)
+            chart_canvas.pack()
+            self._urgency_canvas = chart_canvas
+            # The axes and both lines are created once; redraws only move their coordinates
+            self._chart_items = {
+                'y_axis': chart_canvas.create_line(0, 0, 0, 0, fill='#bbb', width=1),
+                'x_axis': chart_canvas.create_line(0, 0, 0, 0, fill='#bbb', width=1),
+                'before': chart_canvas.create_line(0, 0, 0, 0, fill='#dc3545', width=2),
+                'after': chart_canvas.create_line(0, 0, 0, 0, fill='#28a745', width=2),
+            }
+        items = self._chart_items
+        self._chart_state = chart_state
+
+        # Refill cached priorities if the tracking data changed since last time,
+        # scoring every tracked word in one pass when the tracker supports it
+        if version != self._priority_cache_version:
+            bulk = getattr(self.word_tracker, 'priorities_bulk', None)
+            self._priority_cache = bulk() if bulk is not None else {}
+            self._priority_cache_version = version
+
+        # Collect before/after urgencies for all words straight into their own lists
+        before_urgencies = []
+        after_urgencies = []
         
         # Use all words from word_tracker's data (JSON file), not just vocab_list
         if hasattr(self.word_tracker, 'word_stats') and self.word_tracker.word_stats:
-            # Parse keys from JSON tracking data (format: "source|target")
-            for word_key in self.word_tracker.word_stats.keys():
-                if '|' in word_key:
-                    source, target = word_key.split('|', 1)
-                    before_urgency = self.word_tracker.calculate_word_priority(source, target)
-                    
-                    # Only apply -20 for session words that are not difficult_words
-                    if (source, target) in session_words and (source, target) not in self.difficult_words:
-                        after_urgency = max(0, before_urgency - 20)
-                    elif (source, target) in self.difficult_words:
-                        after_urgency = min(100, before_urgency + 5)
-                    else:
-                        # All other words keep their original urgency
-                        after_urgency = before_urgency
-                    
-                    word_data.append((before_urgency, after_urgency))
-                else:
+            # Match on the JSON tracking keys (format: "source|target") directly,
+            # so no key is split or rebuilt unless its priority isn't cached yet
+            difficult_keys = {f"{source}|{target}" for source, target in difficult_words}
+            session_keys = self._session_keys
+            priority_cache = self._priority_cache
+            for word_key in self.word_tracker.word_stats:
+                if '|' not in word_key:
                     print(f"DEBUG: Invalid word key format: {word_key}. Expected 'source|target'. Skipping.")
+                    continue
+                before_urgency = priority_cache.get(word_key)
+                if before_urgency is None:
+                    source, _, target = word_key.partition('|')
+                    before_urgency = self._cached_priority(source, target, word_key)
+                
+                # Difficult words gain urgency, the rest of the session loses 20
+                if word_key in difficult_keys:
+                    after_urgency = min(100, before_urgency + 5)
+                elif word_key in session_keys:
+                    after_urgency = max(0, before_urgency - 20)
+                else:
+                    # All other words keep their original urgency
+                    after_urgency = before_urgency
+                
+                before_urgencies.append(before_urgency)
+                after_urgencies.append(after_urgency)
         else:
             print("DEBUG: No tracking data found, using vocab_list for urgency chart.")
             # Fallback to vocab_list if no tracking data exists
             for source, target, _ in self.vocab_list:
-                before_urgency = self.word_tracker.calculate_word_priority(source, target)
-                after_urgency = max(0, before_urgency - 20) if (source, target) not in self.difficult_words else min(100, before_urgency + 5)
-                word_data.append((before_urgency, after_urgency))
-        
-        # Sort before and after separately by urgency (highest first)
-        before_urgencies = sorted([x[0] for x in word_data], reverse=True)
-        after_urgencies = sorted([x[1] for x in word_data], reverse=True)
+                before_urgency = self._cached_priority(source, target)
+                after_urgency = max(0, before_urgency - 20) if (source, target) not in difficult_words else min(100, before_urgency + 5)
+                before_urgencies.append(before_urgency)
+                after_urgencies.append(after_urgency)
         
         margin = 10
-        chart_width = width - margin
-        chart_height = height - margin
+        # Sort before and after separately by urgency (highest first), keeping at
+        # most one point per pixel column since more can't be told apart
+        columns = max(2, width - margin + 1)
+        before_urgencies = sorted_samples(before_urgencies, columns)
+        after_urgencies = sorted_samples(after_urgencies, columns)
         # Minimal axes
-        chart_canvas.create_line(margin, margin, margin, height - margin, fill='#bbb', width=1)
-        chart_canvas.create_line(margin, height - margin, width - margin, height - margin, fill='#bbb', width=1)
+        chart_canvas.coords(items['y_axis'], margin, margin, margin, height - margin)
+        chart_canvas.coords(items['x_axis'], margin, height - margin, width - margin, height - margin)
         if len(before_urgencies) > 1:
-            x_step = chart_width / (len(before_urgencies) - 1)
-            before_points = []
-            after_points = []
-            for i, (before, after) in enumerate(zip(before_urgencies, after_urgencies)):
-                x = margin + i * x_step
-                y_before = height - margin - (before / 100) * chart_height
-                y_after = height - margin - (after / 100) * chart_height
-                before_points.extend([x, y_before])
-                after_points.extend([x, y_after])
-            if len(before_points) >= 4:
-                chart_canvas.create_line(before_points, fill='#dc3545', width=2, smooth=True)
-            if len(after_points) >= 4:
-                chart_canvas.create_line(after_points, fill='#28a745', width=2, smooth=True)
+            before_points, after_points = chart_points(tuple(before_urgencies), tuple(after_urgencies),
+                                                       width, height, margin)
+            chart_canvas.coords(items['before'], before_points)
+            chart_canvas.coords(items['after'], after_points)
+            line_state = 'normal'
+        else:
+            line_state = 'hidden'
+        chart_canvas.itemconfigure(items['before'], state=line_state)
+        chart_canvas.itemconfigure(items['after'], state=line_state)
         # No labels, no title, just axes and lines
 
+    def _cached_priority(self, source, target, word_key=None):
+        """Priority from the word tracker, memoized per "source|target" key"""
+        if word_key is None:
+            word_key = f"{source}|{target}"
+        priority = self._priority_cache.get(word_key)
+        if priority is None:
+            priority = self.word_tracker.calculate_word_priority(source, target)
+            self._priority_cache[word_key] = priority
+        return priority
+
     def save_and_exit(self):
         if self.save_allowed:
-            for (source, target, _) in self.vocab_list:
-                if (source, target) in self.difficult_words:
-                    self.word_tracker.mark_word_not_understood(source, target)
-                else:
-                    self.word_tracker.mark_word_used(source, target)
+            difficult = self.difficult_words
+            used = []
+            not_understood = []
+            for source, target, _ in self.vocab_list:
+                key = (source, target)
+                (not_understood if key in difficult else used).append(key)
+            self.word_tracker.mark_bulk(used, not_understood)
             print("💾 Saving new vocabulary tracking data...")
             self.word_tracker.save_tracking_data()
             
             # Commit and push changes to Git after saving
-            print("🔄 Saving changes to Git repository...")
-            self.sync_git_async("push")
+            if self.git_enabled:
+                print("🔄 Saving changes to Git repository...")
+                self.sync_git_async("push")
             
         self.review_complete = True
+        self._release_audio()
         self.root.quit()
         self.root.destroy()
 
@@ -698,110 +1257,146 @@ class VocabularyReviewer:
     def on_close(self):
         # If not checked in feedback, do not save
         self.review_complete = False
+        self._release_audio()
         self.root.quit()
         self.root.destroy()
 
+    def _release_audio(self):
+        """Stop playback, cancel the audio timers and free the VLC players"""
+        # Pending ticks would otherwise fire against the destroyed window
+        self._stop_progress_updates()
+        for job in (self._seek_job, self._speed_job, self._vlc_wait_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        self._seek_job = self._speed_job = self._vlc_wait_job = None
+        # The VLC instance itself is shared and stays for the next session
+        for player in (self.vlc_player, self._prepared_player):
+            if player is not None:
+                player.stop()
+                player.release()
+        self.vlc_player = self._prepared_player = None
+
     def run(self):
         self.root.mainloop()
-        import sys
-        sys.exit(0)
         return self.review_complete
 
     def setup_audio_controls(self):
         """Setup audio controls at the bottom of the interface"""
-        for widget in self.audio_controls_frame.winfo_children():
-            widget.destroy()
+        # The controls are built once; later calls only re-apply the audio source
+        if self._audio_widgets is not None:
+            self._apply_audio_source(self.audio_path)
+            return
 
         # Always show the audio controls area, even if no audio file is present
         audio_frame = ttk.LabelFrame(self.audio_controls_frame, padding="15")
         audio_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        if self.audio_path and os.path.exists(self.audio_path):
-            # Initialize VLC player
-            self.vlc_player = self.vlc_instance.media_player_new() # type: ignore
-            media = self.vlc_instance.media_new(self.audio_path) # type: ignore
-            self.vlc_player.set_media(media)
-            
-            # Top row - Main playback controls
-            controls_row = ttk.Frame(audio_frame)
-            controls_row.pack(fill=tk.X, pady=(0, 10))
-            
-            # Playback controls (centered)
-            playback_frame = ttk.Frame(controls_row)
-            playback_frame.pack(expand=True)
-            
-            self.play_btn = ttk.Button(playback_frame, text="▶ Play", command=self.play_audio, style='Accent.TButton')
-            self.play_btn.pack(side=tk.LEFT, padx=5)
-            
-            self.pause_btn = ttk.Button(playback_frame, text="⏸ Pause", command=self.pause_audio, style='Modern.TButton')
-            self.pause_btn.pack(side=tk.LEFT, padx=5)
-            
-            self.stop_btn = ttk.Button(playback_frame, text="⏹ Stop", command=self.stop_audio, style='Modern.TButton')
-            self.stop_btn.pack(side=tk.LEFT, padx=5)
-            
-            # Separator
-            ttk.Separator(playback_frame, orient='vertical').pack(side=tk.LEFT, fill=tk.Y, padx=15)
-            
-            # Jump controls (prominent)
-            self.jump_back_btn = ttk.Button(playback_frame, text="⏪ -4s", command=lambda: self.jump_audio(-4), style='Modern.TButton')
-            self.jump_back_btn.pack(side=tk.LEFT, padx=5)
-            
-            self.jump_forward_btn = ttk.Button(playback_frame, text="+4s ⏩", command=lambda: self.jump_audio(4), style='Modern.TButton')
-            self.jump_forward_btn.pack(side=tk.LEFT, padx=5)
-            
-            # Separator
-            ttk.Separator(playback_frame, orient='vertical').pack(side=tk.LEFT, fill=tk.Y, padx=15)
-            
-            # Speed controls
-            self.slower_btn = ttk.Button(playback_frame, text="🐌 -5%", command=lambda: self.change_speed(-0.05), style='Modern.TButton')
-            self.slower_btn.pack(side=tk.LEFT, padx=2)
-            
-            self.faster_btn = ttk.Button(playback_frame, text="🐇 +5%", command=lambda: self.change_speed(0.05), style='Modern.TButton')
-            self.faster_btn.pack(side=tk.LEFT, padx=2)
-            
-            # Bottom row - Progress bar
-            progress_row = ttk.Frame(audio_frame)
-            progress_row.pack(fill=tk.X)
-            
-            
-            self.audio_progress = tk.DoubleVar()
-            self.audio_progress_bar = ttk.Scale(progress_row, 
-                                              variable=self.audio_progress, 
-                                              length=500, 
-                                              from_=0, 
-                                              to=100, 
-                                              orient=tk.HORIZONTAL, 
-                                              command=self.slider_seek_update)
-            self.audio_progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
-            self.audio_progress_bar.bind('<ButtonRelease-1>', self.slider_seek_commit)
-            
-            
-            # Initialize audio variables
-            self.audio_length = 1
-            self.audio_speed = .9
-            self._slider_dragging = False
-            self.update_audio_progress()
+        widgets = self._build_audio_row(audio_frame)
+        self.play_btn = widgets['play']
+        self.pause_btn = widgets['pause']
+        self.stop_btn = widgets['stop']
+        self.jump_back_btn = widgets['jump_back']
+        self.jump_forward_btn = widgets['jump_forward']
+        self.slower_btn = widgets['slower']
+        self.faster_btn = widgets['faster']
+        self.audio_progress_bar = widgets['progress']
+        # Only user drags seek; programmatic progress updates must not trigger a seek
+        self.audio_progress_bar.bind('<ButtonPress-1>', self._on_slider_press)
+        self.audio_progress_bar.bind('<B1-Motion>', self._on_slider_drag)
+        self.audio_progress_bar.bind('<ButtonRelease-1>', self.slider_seek_commit)
+        # Keyboard nudges move the Scale too; seek once the key is let go
+        for key in ('Left', 'Right', 'Up', 'Down'):
+            self.audio_progress_bar.bind(f'<KeyRelease-{key}>', self.slider_seek_commit)
+        self._no_audio_label = ttk.Label(audio_frame, text="No audio file available", style='Body.TLabel')
+        self._audio_widgets = widgets
+
+        self._apply_audio_source(self.audio_path)
+
+    def _apply_audio_source(self, path):
+        """Enable or disable the audio controls for path and point the player at it"""
+        self.audio_path = path
+        if path != self._audio_ok_path:
+            self._audio_ok_path = path
+            self._audio_ok = bool(path) and os.path.exists(path)
+        available = self._audio_ok
+        if available:
+            self._start_vlc_probe(path)
+        # Playback stays disabled until the background VLC probe has finished
+        loading = available and not self._vlc_ready.is_set()
+        state = tk.NORMAL if available and not loading else tk.DISABLED
+        for widget in self._audio_widgets.values():
+            widget.configure(state=state)
+        if loading and self._vlc_wait_job is None:
+            self._vlc_wait_job = self.root.after(100, self._wait_for_vlc)
+
+        # Show disabled controls with a note if no audio available
+        if available:
+            self._no_audio_label.pack_forget()
         else:
-            # Show disabled controls if no audio available
-            controls_row = ttk.Frame(audio_frame)
-            controls_row.pack(fill=tk.X, pady=(0, 10))
-            playback_frame = ttk.Frame(controls_row)
-            playback_frame.pack(expand=True)
-            ttk.Button(playback_frame, text="▶ Play", state=tk.DISABLED, style='Accent.TButton').pack(side=tk.LEFT, padx=5)
-            ttk.Button(playback_frame, text="⏸ Pause", state=tk.DISABLED, style='Modern.TButton').pack(side=tk.LEFT, padx=5)
-            ttk.Button(playback_frame, text="⏹ Stop", state=tk.DISABLED, style='Modern.TButton').pack(side=tk.LEFT, padx=5)
-            ttk.Separator(playback_frame, orient='vertical').pack(side=tk.LEFT, fill=tk.Y, padx=15)
-            ttk.Button(playback_frame, text="⏪ -4s", state=tk.DISABLED, style='Modern.TButton').pack(side=tk.LEFT, padx=5)
-            ttk.Button(playback_frame, text="+4s ⏩", state=tk.DISABLED, style='Modern.TButton').pack(side=tk.LEFT, padx=5)
-            ttk.Separator(playback_frame, orient='vertical').pack(side=tk.LEFT, fill=tk.Y, padx=15)
-            ttk.Label(playback_frame, style='Body.TLabel').pack(side=tk.LEFT, padx=(0, 5))
-            ttk.Button(playback_frame, text="🐌 -5%", state=tk.DISABLED, style='Modern.TButton').pack(side=tk.LEFT, padx=2)
-            ttk.Button(playback_frame, text="🐇 +5%", state=tk.DISABLED, style='Modern.TButton').pack(side=tk.LEFT, padx=2)
-            progress_row = ttk.Frame(audio_frame)
-            progress_row.pack(fill=tk.X)
-            ttk.Scale(progress_row, length=500, from_=0, to=100, orient=tk.HORIZONTAL, state=tk.DISABLED).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
-            # Message
-            ttk.Label(audio_frame, text="No audio file available", style='Body.TLabel').pack(pady=10)
+            self._no_audio_label.pack(pady=10)
+
+        # A player prepared for another file is of no use any more
+        if self._prepared_player is not None and path != self._prepared_path:
+            self._prepared_player.release()
+            self._prepared_player = None
+
+        # The VLC player itself is taken on first playback
+        if self.vlc_player is not None:
+            self.stop_audio()
+            self._vlc_time_ms = self._vlc_length_ms = 0
+            self.audio_length = 1
+            if available:
+                self.vlc_player.set_media(self.vlc_instance.media_new(path))
+            else:
+                self.vlc_player.release()
+                self.vlc_player = None
+
+    def _build_audio_row(self, audio_frame):
+        """Build the playback buttons and progress bar, returning the created widgets"""
+        widgets = {}
+
+        # Top row - Main playback controls (centered)
+        controls_row = ttk.Frame(audio_frame)
+        controls_row.pack(fill=tk.X, pady=(0, 10))
+        playback_frame = ttk.Frame(controls_row)
+        playback_frame.pack(expand=True)
+
+        # (name, text, command, style, padx); None separates the button groups:
+        # playback, jump controls (prominent) and speed controls
+        button_specs = (
+            ('play', "▶ Play", self.play_audio, 'Accent.TButton', 5),
+            ('pause', "⏸ Pause", self.pause_audio, 'Modern.TButton', 5),
+            ('stop', "⏹ Stop", self.stop_audio, 'Modern.TButton', 5),
+            None,
+            ('jump_back', "⏪ -4s", functools.partial(self.jump_audio, -4), 'Modern.TButton', 5),
+            ('jump_forward', "+4s ⏩", functools.partial(self.jump_audio, 4), 'Modern.TButton', 5),
+            None,
+            ('slower', "🐌 -5%", functools.partial(self.change_speed, -0.05), 'Modern.TButton', 2),
+            ('faster', "🐇 +5%", functools.partial(self.change_speed, 0.05), 'Modern.TButton', 2),
+        )
+        for spec in button_specs:
+            if spec is None:
+                ttk.Separator(playback_frame, orient='vertical').pack(side=tk.LEFT, fill=tk.Y, padx=15)
+                continue
+            name, text, command, style, padx = spec
+            btn = ttk.Button(playback_frame, text=text, command=command, style=style)
+            btn.pack(side=tk.LEFT, padx=padx)
+            widgets[name] = btn
+
+        # Bottom row - Progress bar
+        progress_row = ttk.Frame(audio_frame)
+        progress_row.pack(fill=tk.X)
+        self.audio_progress = tk.DoubleVar()
+        progress = ttk.Scale(progress_row,
+                             variable=self.audio_progress,
+                             length=500,
+                             from_=0,
+                             to=100,
+                             orient=tk.HORIZONTAL)
+        progress.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        widgets['progress'] = progress
+
+        return widgets
 
 def run_vocabulary_review(vocab_list, word_tracker, generated_text=None, audio_path=None, example_sentences=None):
     app = VocabularyReviewer(vocab_list, word_tracker, generated_text, audio_path, example_sentences)